@@ -11,29 +11,44 @@
 
 from __future__ import annotations
 
+import importlib.util
+import os
 import re
 import shutil
+import stat
+import subprocess
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
 from cyclopts import App, Parameter
-from InquirerPy import inquirer
-from InquirerPy.base import Choice
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.text import Text
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
 
+    import liburing
+    from rich.panel import Panel
+
 console = Console()
 app = App(help='Initialize a new Django project from this starter template.')
 
-PROJECT_NAME_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+PROJECT_NAME_PATTERN = re.compile(r'[a-z0-9][a-z0-9_-]*')
 PROJECT_SECTION_PATTERN = re.compile(r'(^\[project\]\n)(.*?)(?=^\[|\Z)', re.MULTILINE | re.DOTALL)
+PROJECT_FIELD_PATTERN = re.compile(
+    r'^(?P<indent>[ \t]*)(?P<field>[A-Za-z0-9_-]+)[ \t]*=[ \t]*"(?:[^"\\]|\\.)*"[ \t]*$',
+    re.MULTILINE,
+)
+CLEANUP_MAX_WORKERS = 4
+NATIVE_REMOVAL_NAMES = frozenset({'.git', '.venv'})
+BACKGROUND_REMOVAL_NAMES = frozenset({'.git', '.venv'})
+URING_REMOVAL_NAMES = frozenset({'.venv'})
+URING_BATCH_SIZE = 128
+SUPPORTS_DIR_FD = {os.open, os.rmdir, os.unlink} <= os.supports_dir_fd and os.scandir in os.supports_fd
 
 
 @dataclass(frozen=True)
@@ -193,9 +208,10 @@ CLEANUP_TARGETS = [
 CLEANUP_TARGETS_BY_KEY = {target.key: target for target in CLEANUP_TARGETS}
 
 
+@lru_cache(maxsize=32)
 def validate_project_name(name: str | None) -> bool:
     """Return whether a project name is safe for Python package metadata."""
-    return bool(name and PROJECT_NAME_PATTERN.match(name))
+    return bool(name and PROJECT_NAME_PATTERN.fullmatch(name))
 
 
 def project_name_validator(_type: type[str], value: str | None) -> None:
@@ -257,6 +273,8 @@ def is_interactive() -> bool:
 
 def ask_project_name() -> str:
     """Prompt for a valid project name."""
+    from InquirerPy import inquirer  # noqa: PLC0415 - prompt_toolkit is only needed for interactive runs
+
     return inquirer.text(
         message='Project name:',
         validate=lambda value: (
@@ -271,6 +289,8 @@ def ask_description(description: str | None) -> str | None:
     if description:
         return description
 
+    from InquirerPy import inquirer  # noqa: PLC0415
+
     should_add_description = inquirer.confirm(message='Add a custom description?', default=False).execute()
     if not should_add_description:
         return None
@@ -280,6 +300,9 @@ def ask_description(description: str | None) -> str | None:
 
 def ask_cleanup_keys() -> list[str]:
     """Prompt for cleanup targets using InquirerPy checkboxes."""
+    from InquirerPy import inquirer  # noqa: PLC0415
+    from InquirerPy.base import Choice  # noqa: PLC0415
+
     console.print('[dim]Use Space to toggle cleanup targets, then press Enter to continue.[/dim]')
     choices = [
         Choice(target.key, name=f'{target.label} - {target.description}', enabled=target.default)
@@ -299,6 +322,8 @@ def confirm_cleanup(paths: list[Path], base_dir: Path) -> bool:
     if not paths:
         return True
 
+    from InquirerPy import inquirer  # noqa: PLC0415
+
     console.print(build_cleanup_panel(paths, base_dir, title='Confirm Destructive Changes', style='yellow'))
     return inquirer.confirm(message='Continue with deletion?', default=False).execute()
 
@@ -323,6 +348,8 @@ def resolve_options(
             msg = 'Project name is required in non-interactive mode. Pass NAME or --name.'
             raise ValueError(msg)
 
+        from rich.panel import Panel  # noqa: PLC0415 - only the wizard and final report need Rich renderables
+
         console.print(Panel.fit('[bold cyan]Django Project Initialization[/bold cyan]', title='Interactive Setup'))
         resolved_project_name = ask_project_name()
         resolved_description = ask_description(description)
@@ -356,17 +383,220 @@ def resolve_options(
 
 def build_cleanup_panel(paths: list[Path], base_dir: Path, title: str, style: str) -> Panel:
     """Build a panel describing paths selected for deletion."""
+    from rich.panel import Panel  # noqa: PLC0415
+
     target_list = '\n'.join(f' - {path.relative_to(base_dir)}' for path in paths)
     message = f'Initialization will permanently delete:\n{target_list}'
     return Panel.fit(message, title=title, border_style=style)
 
 
-def remove_path(path: Path) -> None:
-    """Remove a file or directory."""
-    if path.is_dir() and not path.is_symlink():
-        shutil.rmtree(path)
+def native_rmtree_command(path: Path) -> list[str] | None:
+    """Return the platform command that removes a directory tree, if one is available."""
+    if os.name == 'posix' and (rm := shutil.which('rm')):
+        return [rm, '-rf', '--', str(path)]
+    if os.name == 'nt' and (cmd := shutil.which('cmd')):
+        return [cmd, '/c', 'rd', '/s', '/q', str(path)]
+    return None
+
+
+def unlink_files(dir_fd: int, names: list[str]) -> None:
+    """Unlink files inside an open directory one at a time."""
+    for name in names:
+        os.unlink(name, dir_fd=dir_fd)
+
+
+def remove_dir_contents(dir_fd: int, remove_files: Callable[[int, list[str]], None] = unlink_files) -> None:
+    """Remove everything inside an open directory without resolving full paths for each entry.
+
+    Subdirectories are emptied and removed first; the remaining entries of each directory go to ``remove_files``.
+    """
+    with os.scandir(dir_fd) as iterator:
+        entries = list(iterator)
+
+    file_names = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            child_fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=dir_fd)
+            try:
+                remove_dir_contents(child_fd, remove_files)
+            finally:
+                os.close(child_fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
+        else:
+            file_names.append(entry.name)
+    remove_files(dir_fd, file_names)
+
+
+def scandir_rmtree(path: Path) -> None:
+    """Remove a directory tree with scandir and directory file descriptors."""
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+    try:
+        remove_dir_contents(dir_fd)
+    finally:
+        os.close(dir_fd)
+    path.rmdir()
+
+
+def uring_unlink_files(ring: liburing.Ring, cqe: liburing.Cqe, dir_fd: int, names: list[str]) -> None:
+    """Unlink files inside an open directory by submitting them to io_uring in batches.
+
+    Every completion in a batch is reaped before the first failed unlink is raised.
+    """
+    import liburing  # noqa: PLC0415 - optional dependency, only used for .venv removal
+
+    for start in range(0, len(names), URING_BATCH_SIZE):
+        batch = names[start : start + URING_BATCH_SIZE]
+        for index, name in enumerate(batch):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_unlink(sqe, name, 0, dir_fd)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        liburing.io_uring_submit(ring)
+
+        failure = None
+        for _ in batch:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            completion = cqe[0]
+            name = batch[completion.user_data]
+            try:
+                res = completion.res
+            except OSError as error:
+                # Some liburing builds raise for a negative result instead of returning it.
+                res = -error.errno
+            liburing.io_uring_cqe_seen(ring, completion)
+            if res < 0 and failure is None:
+                failure = OSError(-res, os.strerror(-res), name)
+        if failure is not None:
+            raise failure
+
+
+def supports_uring_unlink(ring: liburing.Ring) -> bool:
+    """Return whether the running kernel accepts unlinkat requests on an io_uring ring."""
+    import liburing  # noqa: PLC0415
+
+    probe = liburing.io_uring_get_probe_ring(ring)
+    if probe is None:
+        return False
+    try:
+        return liburing.io_uring_opcode_supported(probe, liburing.io_uring_op.IORING_OP_UNLINKAT)
+    finally:
+        liburing.io_uring_free_probe(probe)
+
+
+def uring_rmtree(path: Path) -> bool:
+    """Remove a directory tree with batched io_uring unlinks.
+
+    Returns False when an io_uring ring cannot be created or does not support unlinkat, leaving the directory
+    untouched.
+    """
+    import liburing  # noqa: PLC0415
+
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(URING_BATCH_SIZE, ring)
+    except OSError:
+        return False
+
+    try:
+        if not supports_uring_unlink(ring):
+            return False
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+        try:
+            remove_dir_contents(dir_fd, partial(uring_unlink_files, ring, liburing.Cqe()))
+        finally:
+            os.close(dir_fd)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    path.rmdir()
+    return True
+
+
+def supports_uring_removal(path: Path) -> bool:
+    """Return whether a directory is large enough, and the platform able, to benefit from io_uring removal.
+
+    liburing is optional; install it alongside the script with ``uv run --with liburing init.py``.
+    """
+    return (
+        sys.platform == 'linux'
+        and path.name in URING_REMOVAL_NAMES
+        and importlib.util.find_spec('liburing') is not None
+    )
+
+
+def remove_tree(path: Path) -> None:
+    """Remove a directory tree, using a single native command for large trees such as .git and .venv.
+
+    Smaller trees are removed in-process, where spawning a process would cost more than the removal itself.
+    """
+    command = native_rmtree_command(path) if path.name in NATIVE_REMOVAL_NAMES else None
+    if command is None:
+        if SUPPORTS_DIR_FD:
+            scandir_rmtree(path)
+        else:
+            shutil.rmtree(path)
         return
-    path.unlink()
+
+    try:
+        subprocess.run(command, check=True, capture_output=True)  # noqa: S603 - fixed argv, no shell
+    except subprocess.CalledProcessError as error:
+        details = error.stderr.decode(errors='replace').strip() or f'exit status {error.returncode}'
+        msg = f'Could not remove {path}: {details}'
+        raise OSError(msg) from error
+
+    # rd exits 0 even when locked or in-use files keep it from removing the whole tree.
+    try:
+        path.lstat()
+    except FileNotFoundError:
+        return
+    msg = f'Could not remove {path}'
+    raise OSError(msg)
+
+
+def remove_tree_in_background(path: Path) -> bool:
+    """Rename a directory aside and delete it from a detached process.
+
+    Returns False when no native removal command is available, leaving the directory untouched.
+    """
+    doomed_path = path.with_name(f'{path.name}.deleting-{uuid.uuid4().hex[:8]}')
+    command = native_rmtree_command(doomed_path)
+    if os.name != 'posix' or command is None:
+        return False
+
+    # Renaming is atomic on the same filesystem, so the original name is free immediately.
+    path.rename(doomed_path)
+    subprocess.Popen(  # noqa: S603 - fixed argv, no shell
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    return True
+
+
+def remove_path(path: Path) -> bool:
+    """Remove a file or directory.
+
+    Returns False when the path no longer exists, for example because it was removed after discovery.
+    """
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return False
+
+    if stat.S_ISDIR(mode):
+        # io_uring removal finishes in-process, so it takes precedence over handing the tree to a background rm.
+        if supports_uring_removal(path) and uring_rmtree(path):
+            return True
+        if path.name in BACKGROUND_REMOVAL_NAMES and remove_tree_in_background(path):
+            return True
+        remove_tree(path)
+        return True
+
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
 
 
 def cleanup_paths(paths: list[Path], base_dir: Path, dry_run: bool) -> None:
@@ -375,13 +605,20 @@ def cleanup_paths(paths: list[Path], base_dir: Path, dry_run: bool) -> None:
         console.print('[blue]i[/blue] No cleanup targets found')
         return
 
-    for path in paths:
-        relative_path = path.relative_to(base_dir)
-        if dry_run:
-            console.print(f'[yellow]dry-run[/yellow] Would remove [cyan]{relative_path}[/cyan]')
-            continue
-        remove_path(path)
-        console.print(f'[green]✓[/green] Removed [cyan]{relative_path}[/cyan]')
+    if dry_run:
+        for path in paths:
+            console.print(f'[yellow]dry-run[/yellow] Would remove [cyan]{path.relative_to(base_dir)}[/cyan]')
+        return
+
+    # Discovered paths never overlap, so independent trees such as .git and .venv can be removed concurrently.
+    with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(paths))) as executor:
+        futures = {executor.submit(remove_path, path): path for path in paths}
+        for future in as_completed(futures):
+            relative_path = futures[future].relative_to(base_dir)
+            if future.result():
+                console.print(f'[green]✓[/green] Removed [cyan]{relative_path}[/cyan]')
+            else:
+                console.print(f'[blue]i[/blue] [cyan]{relative_path}[/cyan] not found')
 
 
 def toml_string(value: str) -> str:
@@ -390,24 +627,28 @@ def toml_string(value: str) -> str:
     return f'"{escaped}"'
 
 
-def replace_project_field(content: str, field_name: str, value: str) -> str:
-    """Replace a string field inside the [project] table while preserving surrounding formatting."""
+def replace_project_fields(content: str, fields: dict[str, str]) -> str:
+    """Replace string fields inside the [project] table in a single pass while preserving surrounding formatting."""
     project_match = PROJECT_SECTION_PATTERN.search(content)
     if not project_match:
         msg = '[project] section not found in pyproject.toml'
         raise ValueError(msg)
 
-    project_section = project_match.group(2)
-    field_pattern = re.compile(rf'^(?P<indent>\s*){re.escape(field_name)}\s*=\s*"(?:[^"\\]|\\.)*"\s*$', re.MULTILINE)
-    updated_section, replacements = field_pattern.subn(
-        lambda match: f'{match.group("indent")}{field_name} = {toml_string(value)}',
-        project_section,
-        count=1,
-    )
+    replaced_fields = set()
 
-    if replacements != 1:
-        msg = f'Could not update [project].{field_name} in pyproject.toml'
-        raise ValueError(msg)
+    def replace(match: re.Match[str]) -> str:
+        field_name = match.group('field')
+        if field_name not in fields or field_name in replaced_fields:
+            return match.group(0)
+        replaced_fields.add(field_name)
+        return f'{match.group("indent")}{field_name} = {toml_string(fields[field_name])}'
+
+    updated_section = PROJECT_FIELD_PATTERN.sub(replace, project_match.group(2))
+
+    for field_name in fields:
+        if field_name not in replaced_fields:
+            msg = f'Could not update [project].{field_name} in pyproject.toml'
+            raise ValueError(msg)
 
     return f'{content[: project_match.start(2)]}{updated_section}{content[project_match.end(2) :]}'
 
@@ -529,7 +770,7 @@ def create_readme(base_dir: Path, project_name: str, description: str | None, dr
     if dry_run:
         console.print(f'[yellow]dry-run[/yellow] Would write [cyan]{readme_path.relative_to(base_dir)}[/cyan]')
         return
-    readme_path.write_text(readme_content(project_name, description), encoding='utf-8')
+    readme_path.write_bytes(readme_content(project_name, description).encode('utf-8'))
     console.print('[green]✓[/green] README.md created')
 
 
@@ -542,18 +783,20 @@ def update_pyproject_toml(base_dir: Path, project_name: str, description: str |
 
     content = pyproject_path.read_text(encoding='utf-8')
     new_description = description or f'{project_name} - A Django project'
-    updated_content = replace_project_field(content, 'name', project_name)
-    updated_content = replace_project_field(updated_content, 'description', new_description)
+    updated_content = replace_project_fields(content, {'name': project_name, 'description': new_description})
 
     if dry_run:
         console.print(f'[yellow]dry-run[/yellow] Would update [cyan]{pyproject_path.relative_to(base_dir)}[/cyan]')
         return
-    pyproject_path.write_text(updated_content, encoding='utf-8')
+    pyproject_path.write_bytes(updated_content.encode('utf-8'))
     console.print('[green]✓[/green] pyproject.toml updated')
 
 
 def print_next_steps(project_name: str) -> None:
     """Print recommended next steps after initialization."""
+    from rich.panel import Panel  # noqa: PLC0415
+    from rich.text import Text  # noqa: PLC0415
+
     next_steps = Text()
     next_steps.append('\n1. Remove this script: ', style='bold')
     next_steps.append('rm init.py', style='cyan')
@@ -572,6 +815,9 @@ def print_next_steps(project_name: str) -> None:
 
 def run_initialization(base_dir: Path, options: InitOptions) -> None:
     """Run cleanup and metadata updates for project initialization."""
+    from rich.panel import Panel  # noqa: PLC0415
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn  # noqa: PLC0415
+
     cleanup_targets = discover_cleanup_paths(base_dir, options.cleanup_keys)
 
     if options.dry_run:
@@ -585,10 +831,9 @@ def run_initialization(base_dir: Path, options: InitOptions) -> None:
         BarColumn(),
         TaskProgressColumn(),
         console=console,
+        transient=True,
     ) as progress:
-        task = progress.add_task('[cyan]Setting up project...', total=3)
-
-        progress.update(task, description='[cyan]Cleaning template state...')
+        task = progress.add_task('[cyan]Cleaning template state...', total=3)
         cleanup_paths(cleanup_targets, base_dir, options.dry_run)
         progress.advance(task)
 
@@ -600,8 +845,6 @@ def run_initialization(base_dir: Path, options: InitOptions) -> None:
         update_pyproject_toml(base_dir, options.project_name, options.description, options.dry_run)
         progress.advance(task)
 
-        progress.update(task, description='[green]Setup complete!')
-
     if options.dry_run:
         console.print(Panel.fit('[yellow]Dry run complete. No files were changed.[/yellow]', border_style='yellow'))
         return
@@ -619,7 +862,7 @@ def run_initialization(base_dir: Path, options: InitOptions) -> None:
 def main(
     project_name: Annotated[
         str | None,
-        Parameter(name=['project_name', '--name'], validator=project_name_validator, help='New project name.'),
+        Parameter(name='--name', validator=project_name_validator, help='New project name.'),
     ] = None,
     *,
     description: Annotated[str | None, Parameter(name=['--description', '-d'], help='Project description.')] = None,
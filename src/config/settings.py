@@ -52,28 +52,28 @@ AUTHENTICATION_BACKENDS = [
 ]
 
 # Application definition
-DJANGO_APPS = [
+DJANGO_APPS = (
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-]
-THIRD_PARTY_APPS = [
+)
+THIRD_PARTY_APPS = (
     'allauth',
     'allauth.account',
-]
-LOCAL_APPS = [
+)
+LOCAL_APPS = (
     'config',
     'users',
     'web',
-]
+)
 
-INSTALLED_APPS = [*DJANGO_APPS, *THIRD_PARTY_APPS, *LOCAL_APPS]
+INSTALLED_APPS = (*DJANGO_APPS, *THIRD_PARTY_APPS, *LOCAL_APPS)
 
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -83,7 +83,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware',
-]
+)
 
 ROOT_URLCONF = 'config.urls'
 
@@ -115,6 +115,17 @@ DATABASES = {
     ),
 }
 
+# https://docs.djangoproject.com/en/6.0/ref/databases/#persistent-connections
+# Values given in DATABASE_URL (e.g. ?conn_max_age=600) take precedence over these environment defaults.
+DATABASES['default'].setdefault('CONN_MAX_AGE', env.int('CONN_MAX_AGE', default=60))
+DATABASES['default'].setdefault('CONN_HEALTH_CHECKS', env.bool('CONN_HEALTH_CHECKS', default=True))
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/ref/settings/#cache-middleware-seconds
+# Time-to-live for per-view caches such as the home page. Disabled while DEBUG so template edits show up immediately.
+CACHE_MIDDLEWARE_SECONDS = env.int('CACHE_MIDDLEWARE_SECONDS', default=0 if DEBUG else 60 * 15)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -143,7 +154,9 @@ LANGUAGE_CODE = env('LANGUAGE_CODE', default='en-us')
 
 TIME_ZONE = env('TIME_ZONE')
 
-USE_I18N = True
+# https://docs.djangoproject.com/en/6.0/ref/settings/#use-i18n
+# Off by default because the project ships no translations; enable it once LOCALE_PATHS contains .po files.
+USE_I18N = env.bool('USE_I18N', default=False)
 
 USE_TZ = True
 
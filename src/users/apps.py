@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.contrib.auth.password_validation import get_default_password_validators
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self) -> None:
+        # Instantiate the password validators at startup so CommonPasswordValidator decompresses its word list
+        # before the first signup or password change request, not during it.
+        if not settings.DEBUG:
+            get_default_password_validators()
@@ -1,9 +1,14 @@
+from django.conf import settings
 from django.http import JsonResponse
 from django.http.request import HttpRequest
 from django.http.response import HttpResponse
 from django.shortcuts import render
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 
+@cache_page(settings.CACHE_MIDDLEWARE_SECONDS)
+@vary_on_cookie
 def home(request: HttpRequest) -> HttpResponse:
     return render(request, 'index.html')
 
@@ -23,6 +23,7 @@ SPEC.loader.exec_module(init_script)
         ('MyProject', False),
         ('-project', False),
         ('project name', False),
+        ('project\n', False),
     ],
 )
 def test_validate_project_name(name: str, expected: bool) -> None:
@@ -87,7 +88,7 @@ def test_ask_cleanup_keys_explains_space_bar_selection(monkeypatch: pytest.Monke
         captured_message = kwargs['message']
         return CheckboxPrompt()
 
-    monkeypatch.setattr(init_script.inquirer, 'checkbox', fake_checkbox)
+    monkeypatch.setattr('InquirerPy.inquirer.checkbox', fake_checkbox)
 
     assert init_script.ask_cleanup_keys() == ['venv']
     assert captured_message == 'Select cleanup targets with Space, then press Enter:'
@@ -111,12 +112,25 @@ def test_discover_cleanup_paths_deduplicates_children(tmp_path: Path) -> None:
 def test_replace_project_field_escapes_toml_strings() -> None:
     content = '[project]\nname = "old"\ndescription = "old description"\n\n[tool.example]\nname = "unchanged"\n'
 
-    updated_content = init_script.replace_project_field(content, 'description', 'A "quoted" \\ path')
+    updated_content = init_script.replace_project_fields(content, {'description': 'A "quoted" \\ path'})
 
     assert 'description = "A \\"quoted\\" \\\\ path"' in updated_content
     assert '[tool.example]\nname = "unchanged"' in updated_content
 
 
+def test_replace_project_fields_updates_all_fields_in_one_pass() -> None:
+    content = '[project]\nname = "old"\nversion = "0.1.0"\ndescription = "old description"\n'
+
+    updated_content = init_script.replace_project_fields(content, {'name': 'new', 'description': 'new description'})
+
+    assert updated_content == '[project]\nname = "new"\nversion = "0.1.0"\ndescription = "new description"\n'
+
+
+def test_replace_project_fields_requires_every_field() -> None:
+    with pytest.raises(ValueError, match=r'Could not update \[project\]\.description'):
+        init_script.replace_project_fields('[project]\nname = "old"\n', {'name': 'new', 'description': 'new'})
+
+
 def test_readme_content_uses_django_6_and_project_description() -> None:
     content = init_script.readme_content('billing-api', 'Payments and billing')
 
@@ -152,3 +166,200 @@ def test_dry_run_does_not_remove_or_write_files(tmp_path: Path) -> None:
 def test_unknown_cleanup_key_raises_value_error() -> None:
     with pytest.raises(ValueError, match='Unknown cleanup target'):
         init_script.validate_cleanup_keys(['missing'])
+
+
+def test_remove_path_removes_directory_tree(tmp_path: Path) -> None:
+    tree = tmp_path / 'node_modules'
+    (tree / 'package' / 'lib').mkdir(parents=True)
+    (tree / 'package' / 'lib' / 'index.js').write_text('', encoding='utf-8')
+
+    init_script.remove_path(tree)
+
+    assert not tree.exists()
+
+
+def test_remove_tree_removes_small_trees_in_process(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    commands = []
+    cache_dir = tmp_path / '__pycache__'
+    cache_dir.mkdir()
+    (cache_dir / 'module.cpython-313.pyc').write_text('', encoding='utf-8')
+    monkeypatch.setattr(init_script.subprocess, 'run', lambda command, **_kwargs: commands.append(command))
+
+    init_script.remove_tree(cache_dir)
+
+    assert not cache_dir.exists()
+    assert commands == []
+
+
+def test_remove_tree_falls_back_to_python_without_native_command(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    tree = tmp_path / '.git'
+    (tree / 'objects').mkdir(parents=True)
+    monkeypatch.setattr(init_script, 'native_rmtree_command', lambda _path: None)
+
+    init_script.remove_tree(tree)
+
+    assert not tree.exists()
+
+
+def test_remove_tree_raises_when_rd_leaves_files_behind(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    commands = []
+    tree = tmp_path / '.venv'
+    (tree / 'Scripts').mkdir(parents=True)
+    (tree / 'Scripts' / 'python.exe').write_text('', encoding='utf-8')
+    monkeypatch.setattr(init_script.os, 'name', 'nt')
+    monkeypatch.setattr(init_script.shutil, 'which', lambda name: f'C:\\Windows\\System32\\{name}.exe')
+    # rd reports success without removing files that are locked by another process.
+    monkeypatch.setattr(
+        init_script.subprocess,
+        'run',
+        lambda command, **_kwargs: commands.append(command) or init_script.subprocess.CompletedProcess(command, 0),
+    )
+
+    with pytest.raises(OSError, match='Could not remove'):
+        init_script.remove_tree(tree)
+
+    assert commands == [['C:\\Windows\\System32\\cmd.exe', '/c', 'rd', '/s', '/q', str(tree)]]
+
+
+@pytest.mark.skipif(not init_script.SUPPORTS_DIR_FD, reason='requires dir_fd support')
+def test_scandir_rmtree_does_not_follow_symlinks(tmp_path: Path) -> None:
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    (outside / 'keep.txt').write_text('', encoding='utf-8')
+    tree = tmp_path / '.venv'
+    (tree / 'lib').mkdir(parents=True)
+    (tree / 'lib' / 'module.py').write_text('', encoding='utf-8')
+    (tree / 'linked').symlink_to(outside, target_is_directory=True)
+
+    init_script.scandir_rmtree(tree)
+
+    assert not tree.exists()
+    assert (outside / 'keep.txt').exists()
+
+
+def test_cleanup_paths_removes_all_selected_paths(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(init_script.subprocess, 'Popen', lambda _command, **_kwargs: None)
+    (tmp_path / '.git' / 'objects').mkdir(parents=True)
+    (tmp_path / '.venv' / 'lib').mkdir(parents=True)
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'db.sqlite3').write_text('', encoding='utf-8')
+    paths = init_script.discover_cleanup_paths(tmp_path, ['git', 'venv', 'sqlite'])
+
+    init_script.cleanup_paths(paths, tmp_path, dry_run=False)
+
+    assert not any(path.exists() for path in paths)
+
+
+def test_remove_path_detaches_large_tree_removal(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    commands = []
+    git_dir = tmp_path / '.git'
+    (git_dir / 'objects').mkdir(parents=True)
+    monkeypatch.setattr(init_script.os, 'name', 'posix')
+    monkeypatch.setattr(init_script, 'native_rmtree_command', lambda path: ['rm', '-rf', '--', str(path)])
+    monkeypatch.setattr(init_script.subprocess, 'Popen', lambda command, **_kwargs: commands.append(command))
+
+    init_script.remove_path(git_dir)
+
+    assert not git_dir.exists()
+    assert len(commands) == 1
+    assert Path(commands[0][-1]).name.startswith('.git.deleting-')
+
+
+def test_remove_path_prefers_uring_over_background_removal(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    uring_paths = []
+
+    def fake_uring_rmtree(path: Path) -> bool:
+        uring_paths.append(path)
+        init_script.scandir_rmtree(path)
+        return True
+
+    def fail_background(_path: Path) -> bool:
+        pytest.fail('.venv was handed to a background rm instead of io_uring')
+
+    venv = tmp_path / '.venv'
+    (venv / 'lib').mkdir(parents=True)
+    monkeypatch.setattr(init_script, 'supports_uring_removal', lambda path: path.name == '.venv')
+    monkeypatch.setattr(init_script, 'uring_rmtree', fake_uring_rmtree)
+    monkeypatch.setattr(init_script, 'remove_tree_in_background', fail_background)
+
+    assert init_script.remove_path(venv) is True
+    assert uring_paths == [venv]
+    assert not venv.exists()
+
+
+requires_uring = pytest.mark.skipif(
+    not init_script.supports_uring_removal(Path('.venv')),
+    reason='requires liburing on Linux',
+)
+
+
+@requires_uring
+def test_cleanup_paths_removes_venv_with_uring(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(init_script.subprocess, 'Popen', lambda _command, **_kwargs: pytest.fail('spawned rm'))
+    venv = tmp_path / '.venv'
+    (venv / 'lib').mkdir(parents=True)
+    for index in range(init_script.URING_BATCH_SIZE + 1):
+        (venv / 'lib' / f'module_{index}.py').write_text('', encoding='utf-8')
+
+    init_script.cleanup_paths([venv], tmp_path, dry_run=False)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@requires_uring
+def test_uring_rmtree_raises_failed_unlink(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    uring_unlink_files = init_script.uring_unlink_files
+
+    def unlink_with_missing_file(ring: object, cqe: object, dir_fd: int, names: list[str]) -> None:
+        uring_unlink_files(ring, cqe, dir_fd, [*names, 'missing.py'])
+
+    monkeypatch.setattr(init_script, 'uring_unlink_files', unlink_with_missing_file)
+    venv = tmp_path / '.venv'
+    venv.mkdir()
+    (venv / 'module.py').write_text('', encoding='utf-8')
+
+    with pytest.raises(FileNotFoundError) as error:
+        init_script.uring_rmtree(venv)
+
+    assert error.value.filename == 'missing.py'
+    assert not (venv / 'module.py').exists()
+
+
+def test_initialization_writes_readme_and_pyproject(tmp_path: Path) -> None:
+    (tmp_path / 'pyproject.toml').write_text(
+        '[project]\nname = "old"\ndescription = "old description"\n',
+        encoding='utf-8',
+    )
+
+    init_script.create_readme(tmp_path, 'new-project', 'Café ordering', dry_run=False)
+    init_script.update_pyproject_toml(tmp_path, 'new-project', 'Café ordering', dry_run=False)
+
+    assert (tmp_path / 'README.md').read_text(encoding='utf-8').startswith('# new-project\n')
+    assert (tmp_path / 'pyproject.toml').read_bytes() == (
+        '[project]\nname = "new-project"\ndescription = "Café ordering"\n'.encode()
+    )
+
+
+def test_remove_path_reports_missing_path(tmp_path: Path) -> None:
+    assert init_script.remove_path(tmp_path / 'db.sqlite3') is False
+
+
+def test_remove_path_unlinks_directory_symlink_without_following(tmp_path: Path) -> None:
+    target = tmp_path / 'target'
+    target.mkdir()
+    link = tmp_path / 'node_modules'
+    link.symlink_to(target, target_is_directory=True)
+
+    assert init_script.remove_path(link) is True
+    assert not link.exists()
+    assert target.exists()
+
+
+@pytest.mark.parametrize('tokens', [['--name', 'demo-app'], ['demo-app']])
+def test_cli_accepts_project_name_as_option_or_positional(tokens: list[str]) -> None:
+    _command, bound, _ignored = init_script.app.parse_args(tokens, exit_on_error=False, print_error=False)
+
+    assert bound.arguments['project_name'] == 'demo-app'
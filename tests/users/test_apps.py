@@ -0,0 +1,29 @@
+"""Tests for users.apps."""
+
+from django.apps import apps
+from django.contrib.auth.password_validation import get_default_password_validators
+from django.test import override_settings
+
+# ---------------------------------------------------------------------------
+# UsersConfig
+# ---------------------------------------------------------------------------
+
+
+@override_settings(DEBUG=False)
+def test_ready_preloads_password_validators() -> None:
+    """Outside DEBUG, startup builds the cached password validators."""
+    get_default_password_validators.cache_clear()
+
+    apps.get_app_config('users').ready()
+
+    assert get_default_password_validators.cache_info().currsize == 1
+
+
+@override_settings(DEBUG=True)
+def test_ready_skips_preload_in_debug() -> None:
+    """In DEBUG, the validators are left to load lazily on first use."""
+    get_default_password_validators.cache_clear()
+
+    apps.get_app_config('users').ready()
+
+    assert get_default_password_validators.cache_info().currsize == 0
@@ -1,6 +1,7 @@
 from collections.abc import Generator
 
 import pytest
+from django.core.cache import cache
 from django.test import override_settings
 
 
@@ -21,3 +22,16 @@ def _use_staticfiles_storage() -> Generator[None]:
         },
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Generator[None]:
+    """Start every test with an empty cache.
+
+    The home view is wrapped in ``cache_page``. Without clearing, a response
+    cached by one test would be served to the next, and Django's test client
+    would not record the rendered templates in ``response.templates``.
+    """
+    cache.clear()
+    yield
+    cache.clear()
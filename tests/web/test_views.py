@@ -3,6 +3,7 @@
 from http import HTTPStatus
 
 import pytest
+from django.conf import settings
 from django.test import Client
 from django.urls import reverse
 
@@ -36,6 +37,35 @@ def test_home_accessible_to_anonymous_users(client: Client) -> None:
     assert response.status_code == HTTPStatus.OK
 
 
+@pytest.mark.django_db
+def test_home_cache_control_matches_cache_setting(client: Client) -> None:
+    """The home page advertises the configured per-view cache lifetime."""
+    url = reverse('web:home')
+    response = client.get(url)
+    assert response.headers['Cache-Control'] == f'max-age={settings.CACHE_MIDDLEWARE_SECONDS}'
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    settings.CACHE_MIDDLEWARE_SECONDS == 0,
+    reason='home page caching is disabled (CACHE_MIDDLEWARE_SECONDS=0, the default with DEBUG=True)',
+)
+def test_home_second_request_is_served_from_cache(client: Client) -> None:
+    """A repeat GET / is answered from the cache without rendering templates."""
+    url = reverse('web:home')
+    client.get(url)
+    response = client.get(url)
+    assert response.templates == []
+
+
+@pytest.mark.django_db
+def test_home_cache_varies_on_cookie(client: Client) -> None:
+    """Cached home pages are keyed per cookie so flash messages are never shared."""
+    url = reverse('web:home')
+    response = client.get(url)
+    assert 'Cookie' in response.headers['Vary']
+
+
 def test_health_status_code(client: Client) -> None:
     """GET /health/ returns HTTP 200 OK."""
     url = reverse('web:health')